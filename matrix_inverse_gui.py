@@ -9,52 +9,170 @@ Enhancements:
 - Size selector (Spinbox) restricted to matrix sizes 2–5 with validation
 - Placeholder controls: "Compute Inverse" and "Clear"
 - Distinct sections: Input Matrix and Inverse (Result) with labeled headings
-- Results area uses a disabled Text widget as a placeholder
+- Input Entry grid is created on Compute, sized to the selected matrix size
+- Results area shows a lightweight Label placeholder, replaced by a disabled
+  Text widget once there is output to display
 - Layout weights ensure input and result sections expand gracefully
 - Run guard to start mainloop
 """
 
+from __future__ import annotations
+
+import re
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import ttk
+
 # Constants for matrix size limits
 MIN_MATRIX_SIZE = 2
 MAX_MATRIX_SIZE = 5
 DEFAULT_MATRIX_SIZE = 3
 
-import tkinter as tk
-from tkinter import ttk
+WINDOW_TITLE = "Matrix Inverse Calculator"
+# Suggested comfortable size for 5x5 grid area, and the minimum that keeps the layout usable
+WINDOW_GEOMETRY = "900x600"
+WINDOW_MINSIZE = (700, 450)
+
+RESULTS_PLACEHOLDER = "Result will appear here after computation. This is a placeholder."
+
+# Accepts what int() would parse to an in-range size (surrounding whitespace,
+# a leading "+", leading zeros and digit-group underscores), or empty while
+# editing. Sizes are single-digit, so only the last digit carries the value.
+_VALID_RE = re.compile(rf"(?:\s*\+?(?:0_?)*[{MIN_MATRIX_SIZE}-{MAX_MATRIX_SIZE}]\s*)?")
+# Any integer literal int() accepts once stripped; committed values matching
+# this are clamped into range
+_INT_RE = re.compile(r"[+-]?\d+(?:_\d+)*")
+
+# Bindtag carrying the <Return>/<FocusOut> size-correction handlers
+_SIZE_SPIN_TAG = "SizeSpin"
+# Spinbox -> weak reference to its owning app, so the interpreter-wide tag
+# binding reaches the right instance when several apps share one Tk root.
+# The app holds its spinbox, so a strong value would keep both alive forever.
+_SIZE_SPIN_OWNERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Widget options shared by every app instance, built once at import time
+_CONTROLS_PAD = (10, 10)
+_SECTION_PAD = (10, 5)
+# Fixed requested sizes for the input grid and results panes. Geometry
+# propagation is off for both, so adding or removing cells does not make
+# Tk re-measure the whole window.
+_INPUT_GRID_SIZE = {"width": 480, "height": 240}
+_RESULTS_SECTION_SIZE = {"width": 480, "height": 160}
+# Quiet period (ms) after the last <Configure> before the layout is refreshed
+_RESIZE_DEBOUNCE_MS = 50
+_SPINBOX_KW = {"width": 5, "wrap": False, "justify": "center"}
+_ENTRY_KW = {"width": 8, "justify": "center"}
+_CELL_GRID_KW = {"sticky": "ew", "padx": 2, "pady": 2}
+# The results Text is read-only, so it needs no undo bookkeeping
+_RESULTS_TEXT_KW = {
+    "height": 8,
+    "wrap": "word",
+    "undo": False,
+    "autoseparators": False,
+    "maxundo": 0,
+}
+
+
+def _load_tk() -> None:
+    """
+    Imports tkinter and ttk into the module namespace on first use.
+
+    Keeps `import matrix_inverse_gui` cheap for consumers that never build
+    the GUI; repeated calls only hit the `sys.modules` cache.
+    """
+    global tk, ttk
+    import tkinter as tk
+    from tkinter import ttk
+
+
+def _on_size_spin_commit(event: tk.Event) -> None:
+    """Forwards <Return>/<FocusOut> on a size spinbox to the app that owns it."""
+    app_ref = _SIZE_SPIN_OWNERS.get(event.widget)
+    app = app_ref() if app_ref is not None else None
+    if app is not None:
+        app._schedule_size_check(event)
+
+
+def _grid_label(parent: tk.Misc, text: str, row: int, column: int, **grid_kw) -> ttk.Label:
+    """Creates a static heading Label and grids it in one step."""
+    label = ttk.Label(parent, text=text)
+    label.grid(row=row, column=column, **grid_kw)
+    return label
 
 
 class MatrixInverseApp:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "master",
+        "size_var",
+        "validate_cmd",
+        "_validate_job",
+        "_resize_job",
+        "input_entries",
+        "results_text",
+        "_last_results",
+        "size_spin",
+        "compute_btn",
+        "clear_btn",
+        "input_grid_frame",
+        "results_section",
+        "placeholder_label",
+        # Lets _SIZE_SPIN_OWNERS refer to the app weakly
+        "__weakref__",
+    )
+
     def __init__(self, master: tk.Tk):
+        _load_tk()
         self.master = master
+        # Build while withdrawn so Tk lays the window out once at the end
+        # rather than after each widget; a root that was already hidden
+        # (e.g. by the caller) stays hidden.
+        was_shown = master.state() != "withdrawn"
+        master.withdraw()
         self._configure_root()
         self._init_state()
-        self._build_layout()
+        self._build_controls()
+        self._build_input_area()
+        self._build_results_area()
+        master.update_idletasks()
+        if was_shown:
+            master.deiconify()
 
     # Root/window configuration
     def _configure_root(self) -> None:
-        self.master.title("Matrix Inverse Calculator")
-        # Suggested comfortable size for 5x5 grid area
-        self.master.geometry("900x600")
-        # Sensible minimum size to keep layout usable
-        self.master.minsize(700, 450)
-        # Ensure content can expand
-        self.master.rowconfigure(0, weight=0)
+        self.master.title(WINDOW_TITLE)
+        self.master.geometry(WINDOW_GEOMETRY)
+        self.master.minsize(*WINDOW_MINSIZE)
+        # Ensure content can expand (row 0, the controls, keeps the default weight 0)
         self.master.rowconfigure(1, weight=2)
         self.master.rowconfigure(2, weight=1)
         self.master.columnconfigure(0, weight=1)
 
     def _init_state(self) -> None:
-        # IntVar for matrix size (MIN_MATRIX_SIZE–MAX_MATRIX_SIZE), default DEFAULT_MATRIX_SIZE
-        self.size_var = tk.IntVar(value=DEFAULT_MATRIX_SIZE)
+        # StringVar for matrix size (MIN_MATRIX_SIZE–MAX_MATRIX_SIZE), default DEFAULT_MATRIX_SIZE.
+        # Parsed explicitly by _ensure_valid_size, so reads never raise TclError.
+        self.size_var = tk.StringVar(value=str(DEFAULT_MATRIX_SIZE))
         # Register validation command for spinbox
         self.validate_cmd = self.master.register(self._validate_size)
+        # Pending after_idle job for the coalesced size correction
+        self._validate_job = None
+        # Pending after job for the debounced resize refresh
+        self._resize_job = None
+        # Widgets created on demand (see _build_input_grid / _promote_to_text)
+        self.input_entries = []
+        self.results_text = None
+        # Text currently shown in the results pane
+        self._last_results = RESULTS_PLACEHOLDER
 
-    def _build_layout(self) -> None:
+    def _build_controls(self) -> None:
         # Controls frame (top)
-        controls = ttk.Frame(self.master, padding=(10, 10))
+        controls = ttk.Frame(self.master, padding=_CONTROLS_PAD)
         controls.grid(row=0, column=0, sticky="ew")
         # Configure columns for controls frame:
-        # Col 0: size_label (fixed)
+        # Col 0: "Matrix Size" label (fixed)
         # Col 1: size_spin (fixed)
         # Col 2: (empty, fixed)
         # Col 3: spacer/stretch (expands)
@@ -63,79 +181,193 @@ class MatrixInverseApp:
         controls.columnconfigure((0, 1, 2, 4, 5), weight=0)
         controls.columnconfigure(3, weight=1) # Spacer column expands
 
-        # Matrix Size label
-        size_label = ttk.Label(controls, text="Matrix Size")
-        size_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
+        _grid_label(controls, "Matrix Size", 0, 0, sticky="w", padx=(0, 8))
 
-        # Size selector Spinbox (MIN_MATRIX_SIZE–MAX_MATRIX_SIZE), default shown from IntVar
+        # Size selector Spinbox (MIN_MATRIX_SIZE–MAX_MATRIX_SIZE), default shown from size_var
         self.size_spin = ttk.Spinbox(
             controls,
             from_=MIN_MATRIX_SIZE,
             to=MAX_MATRIX_SIZE,
             textvariable=self.size_var,
-            width=5,
-            wrap=False,
-            justify="center",
-            validate="all",
-            validatecommand=(self.validate_cmd, '%P')
+            validate="key",
+            validatecommand=(self.validate_cmd, '%P'),
+            **_SPINBOX_KW,
         )
         self.size_spin.grid(row=0, column=1, sticky="w")
-        # Bind additional event to validate on Return key
-        self.size_spin.bind('<Return>', lambda e: self._ensure_valid_size())
+        # Correct the committed value on Return or when focus leaves. The
+        # handlers live on a shared bindtag, so any further size spinboxes
+        # only need the tag rather than their own bindings.
+        self.size_spin.bindtags((_SIZE_SPIN_TAG, *self.size_spin.bindtags()))
+        _SIZE_SPIN_OWNERS[self.size_spin] = weakref.ref(self)
+        # The tag is shared per Tcl interpreter; bind it on the first app only
+        if not self.master.bind_class(_SIZE_SPIN_TAG, '<Return>'):
+            self.master.bind_class(_SIZE_SPIN_TAG, '<Return>', _on_size_spin_commit)
+            self.master.bind_class(_SIZE_SPIN_TAG, '<FocusOut>', _on_size_spin_commit)
 
-        # Placeholder buttons
-        self.compute_btn = ttk.Button(controls, text="Compute Inverse")
+        self.compute_btn = ttk.Button(
+            controls, text="Compute Inverse", command=self._on_compute
+        )
         self.compute_btn.grid(row=0, column=4, padx=(8, 8))
 
-        self.clear_btn = ttk.Button(controls, text="Clear")
+        self.clear_btn = ttk.Button(controls, text="Clear", command=self._on_clear)
         self.clear_btn.grid(row=0, column=5)
 
+    def _build_input_area(self) -> None:
         # Input section container
-        input_section = ttk.Frame(self.master, padding=(10, 5))
+        input_section = ttk.Frame(self.master, padding=_SECTION_PAD)
         input_section.grid(row=1, column=0, sticky="nsew")
         input_section.rowconfigure(1, weight=1)  # grid area grows
         input_section.columnconfigure(0, weight=1)
 
-        input_label = ttk.Label(input_section, text="Input Matrix")
-        input_label.grid(row=0, column=0, sticky="w", pady=(0, 6))
+        _grid_label(input_section, "Input Matrix", 0, 0, sticky="w", pady=(0, 6))
 
-        # Placeholder for future Entry grid
-        self.input_grid_frame = ttk.Frame(input_section, relief="groove", padding=10)
+        # Container for the Entry grid; cells are created by _build_input_grid
+        # once a size is confirmed, not at startup.
+        self.input_grid_frame = ttk.Frame(
+            input_section, relief="groove", padding=10, **_INPUT_GRID_SIZE
+        )
         self.input_grid_frame.grid(row=1, column=0, sticky="nsew")
-        self.input_grid_frame.rowconfigure(0, weight=1)
-        self.input_grid_frame.columnconfigure(0, weight=1)
+        self.input_grid_frame.grid_propagate(False)
 
+    def _build_results_area(self) -> None:
         # Results section container
-        results_section = ttk.Frame(self.master, padding=(10, 5))
-        results_section.grid(row=2, column=0, sticky="nsew")
-        results_section.rowconfigure(1, weight=1)
-        results_section.columnconfigure(0, weight=1)
-
-        results_label = ttk.Label(results_section, text="Inverse (Result)")
-        results_label.grid(row=0, column=0, sticky="w", pady=(0, 6))
+        self.results_section = ttk.Frame(
+            self.master, padding=_SECTION_PAD, **_RESULTS_SECTION_SIZE
+        )
+        self.results_section.grid(row=2, column=0, sticky="nsew")
+        self.results_section.grid_propagate(False)
+        self.results_section.rowconfigure(1, weight=1)
+        self.results_section.columnconfigure(0, weight=1)
 
-        # Disabled Text widget as placeholder for results
-        self.results_text = tk.Text(results_section, height=8, wrap="word")
-        self.results_text.grid(row=1, column=0, sticky="nsew")
+        _grid_label(self.results_section, "Inverse (Result)", 0, 0, sticky="w", pady=(0, 6))
 
-        # Insert placeholder text and disable editing
-        self._set_results_placeholder(
-            "Result will appear here after computation. This is a placeholder."
+        # A plain Label shows the placeholder; the heavier Text widget is only
+        # created once there is real output to display (see _promote_to_text).
+        self.placeholder_label = ttk.Label(
+            self.results_section, text=RESULTS_PLACEHOLDER, anchor="nw"
         )
+        self.placeholder_label.grid(row=1, column=0, sticky="nsew")
+        # <Configure> fires for every step of an interactive resize; only the
+        # last one in a burst refreshes the layout (see _on_resize).
+        self.results_section.bind('<Configure>', self._on_resize)
 
-    def _set_results_placeholder(self, text: str) -> None:
+    def _on_resize(self, event=None) -> None:
+        """
+        Defers `_apply_layout` until resize events stop arriving.
+
+        Each event replaces the pending job, so dragging the window edge
+        runs the refresh once, `_RESIZE_DEBOUNCE_MS` after the drag settles.
+        """
+        if self._resize_job is not None:
+            self.master.after_cancel(self._resize_job)
+        self._resize_job = self.master.after(_RESIZE_DEBOUNCE_MS, self._apply_layout)
+
+    def _apply_layout(self) -> None:
+        # Re-wrap the placeholder text to the current width of the results pane
+        self._resize_job = None
+        if self.placeholder_label is not None:
+            self.placeholder_label.configure(
+                wraplength=max(self.placeholder_label.winfo_width(), 1)
+            )
+
+    def _build_input_grid(self, size: int) -> None:
+        """
+        Creates exactly `size` x `size` Entry cells in the input grid frame.
+
+        Existing cells are kept when the size is unchanged, so repeated
+        Compute presses do not rebuild the grid.
+        """
+        old_size = len(self.input_entries)
+        if old_size == size:
+            return
+        for row in self.input_entries:
+            for entry in row:
+                entry.destroy()
+        # Row/column weights are set with one call per axis, not one per index
+        frame = self.input_grid_frame
+        if old_size > size:
+            # Release the stretch weight of rows/columns that are now unused
+            stale = tuple(range(size, old_size))
+            frame.rowconfigure(stale, weight=0)
+            frame.columnconfigure(stale, weight=0)
+        self.input_entries = []
+        for r in range(size):
+            row = []
+            for c in range(size):
+                entry = ttk.Entry(frame, **_ENTRY_KW)
+                entry.grid(row=r, column=c, **_CELL_GRID_KW)
+                row.append(entry)
+            self.input_entries.append(row)
+        cells = tuple(range(size))
+        frame.rowconfigure(cells, weight=1)
+        frame.columnconfigure(cells, weight=1)
+
+    def _promote_to_text(self) -> None:
+        """
+        Replaces the placeholder Label with a disabled Text widget.
+
+        Called on the first real result; later calls are no-ops.
+        """
+        if self.results_text is not None:
+            return
+        self.placeholder_label.destroy()
+        self.placeholder_label = None
+        # Resizes only re-wrapped the placeholder, so stop tracking them
+        self.results_section.unbind('<Configure>')
+        if self._resize_job is not None:
+            self.master.after_cancel(self._resize_job)
+            self._resize_job = None
+        self.results_text = tk.Text(self.results_section, **_RESULTS_TEXT_KW)
+        self.results_text.grid(row=1, column=0, sticky="nsew")
+
+    def _write_results_text(self, text: str) -> None:
         self.results_text.configure(state="normal")
         self.results_text.delete("1.0", tk.END)
         self.results_text.insert("1.0", text)
         self.results_text.configure(state="disabled")
+
+    def _set_results_placeholder(self, text: str) -> None:
+        # Skip the Tk round-trips and redraw when the content would not change
+        if text == self._last_results:
+            return
+        if self.results_text is None:
+            self.placeholder_label.configure(text=text)
+        else:
+            self._write_results_text(text)
+        self._last_results = text
+
+    def _set_results(self, text: str) -> None:
+        """
+        Shows computed output, switching the pane to a Text widget if needed.
+
+        Nothing in this skeleton computes an inverse yet, so only the tests
+        call this; it is the hook a future solver will use from _on_compute.
+        Until then the pane only ever shows the placeholder Label.
+        """
+        if text == self._last_results:
+            return
+        self._promote_to_text()
+        self._write_results_text(text)
+        self._last_results = text
+
+    def _on_compute(self) -> None:
+        self._build_input_grid(self._ensure_valid_size())
+        self._set_results_placeholder(RESULTS_PLACEHOLDER)
+
+    def _on_clear(self) -> None:
+        for row in self.input_entries:
+            for entry in row:
+                entry.delete(0, tk.END)
+        self._set_results_placeholder(RESULTS_PLACEHOLDER)
     
     def _validate_size(self, value_if_allowed: str) -> bool:
         """
         Validates the proposed spinbox value.
         
         This method is called by the `validatecommand` when the spinbox's content changes
-        (due to `validate='all'`). It checks if the `value_if_allowed`
-        is a valid integer within the allowed range (2-5).
+        (due to `validate='key'`). It checks if the `value_if_allowed`
+        is a valid integer within the allowed range (2-5), using a precompiled
+        pattern so no int() conversion or exception handling runs per keystroke.
         
         Args:
             value_if_allowed: The proposed value as a string.
@@ -145,41 +377,52 @@ class MatrixInverseApp:
             False if the value is invalid, which will cause Tkinter to revert the spinbox
             to its last valid state and also revert the `textvariable`.
         """
-        if value_if_allowed == "":
-            # Allow empty string during editing. Tkinter will revert on focus out if not filled.
-            return True
-        
-        try:
-            val = int(value_if_allowed)
-            return MIN_MATRIX_SIZE <= val <= MAX_MATRIX_SIZE
-        except ValueError:
-            # Not a valid integer
-            return False
+        # An empty string is allowed during editing; it is corrected on Return/focus out.
+        return _VALID_RE.fullmatch(value_if_allowed) is not None
     
-    def _ensure_valid_size(self) -> None:
+    def _schedule_size_check(self, event=None) -> None:
+        """
+        Queues a single `_ensure_valid_size` pass for when Tk is next idle.
+
+        <Return> and <FocusOut> often arrive back to back (e.g. Enter then Tab),
+        so later events join the pending pass rather than queue their own. The
+        pass reads the variable when it runs, so it always sees the latest value.
+        """
+        if self._validate_job is None:
+            self._validate_job = self.master.after_idle(self._run_size_check)
+
+    def _run_size_check(self) -> None:
+        self._validate_job = None
+        self._ensure_valid_size()
+
+    def _ensure_valid_size(self) -> int:
         """
         Ensures the `size_var` (and thus the spinbox value) is within the valid range (2-5).
         
-        This method is typically called after a user action (e.g., pressing Enter)
-        to explicitly correct an out-of-range or non-integer value that might have
-        been temporarily set in the `IntVar` or not caught by `validatecommand`.
-        If the `IntVar` holds a non-integer value (e.g., user typed "abc" and pressed Enter
-        before validation), it resets it to the default (3).
+        This method is typically called after a user action (e.g., pressing Enter
+        or leaving the spinbox) to explicitly correct an out-of-range or non-integer
+        value that was not caught by `validatecommand`.
+        Integers outside the range are clamped; anything else (e.g. "abc" or an
+        empty field) is reset to the default (3). The raw string is matched
+        against a pattern first, so no exception is raised for garbled input.
+        
+        Returns:
+            The corrected matrix size as an int.
         """
-        try:
-            current_value = self.size_var.get()
-            # Correct if current value is outside the allowed range
-            if current_value < MIN_MATRIX_SIZE:
-                self.size_var.set(MIN_MATRIX_SIZE)
-            elif current_value > MAX_MATRIX_SIZE:
-                self.size_var.set(MAX_MATRIX_SIZE)
-        except tk.TclError:
-            # If size_var holds a non-integer string (e.g., from direct entry not caught by validation)
-            # Reset to default.
-            self.size_var.set(DEFAULT_MATRIX_SIZE)
+        raw = self.size_var.get()
+        stripped = raw.strip()
+        if _INT_RE.fullmatch(stripped) is None:
+            size = DEFAULT_MATRIX_SIZE
+        else:
+            size = min(max(int(stripped), MIN_MATRIX_SIZE), MAX_MATRIX_SIZE)
+        # Compare the unstripped text so values like " 3" are normalized too
+        if raw != str(size):
+            self.size_var.set(str(size))
+        return size
 
 
 def main() -> None:
+    _load_tk()
     root = tk.Tk()
     app = MatrixInverseApp(root)
     root.mainloop()
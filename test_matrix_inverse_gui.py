@@ -5,8 +5,11 @@ This test file includes a test that verifies the Spinbox validation
 bug is fixed - ensuring manual entry is restricted to valid range 2-5.
 """
 
+import gc
 import unittest
+import weakref
 import tkinter as tk
+import matrix_inverse_gui
 from matrix_inverse_gui import MatrixInverseApp
 
 
@@ -54,36 +57,36 @@ class TestMatrixInverseApp(unittest.TestCase):
         """
         # Test 1: Try to set a value below minimum (1)
         self._set_spin_value_and_validate("1")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertGreaterEqual(value, 2, 
                                 f"Spinbox should reject value 1, but got {value}")
         
         # Test 2: Try to set a value above maximum (10)
         self._set_spin_value_and_validate("10")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertLessEqual(value, 5,
                              f"Spinbox should reject value 10, but got {value}")
         
         # Test 3: Try to set a negative value (-3)
         self._set_spin_value_and_validate("-3")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertGreaterEqual(value, 2,
                                 f"Spinbox should reject value -3, but got {value}")
         
         # Test 4: Valid values should be accepted (3)
         self._set_spin_value_and_validate("3")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertEqual(value, 3,
                         f"Spinbox should accept value 3, but got {value}")
         
         # Test 5: Valid boundary values (2 and 5)
         self._set_spin_value_and_validate("2")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertEqual(value, 2,
                         f"Spinbox should accept value 2, but got {value}")
         
         self._set_spin_value_and_validate("5")
-        value = self.app.size_var.get()
+        value = int(self.app.size_var.get())
         self.assertEqual(value, 5,
                         f"Spinbox should accept value 5, but got {value}")
 
@@ -97,23 +100,113 @@ class TestMatrixInverseApp(unittest.TestCase):
         self.assertFalse(self.app._validate_size("6"))
         self.assertFalse(self.app._validate_size("abc"))
         self.assertFalse(self.app._validate_size("-1"))
+        # Same inputs int() accepts, e.g. when a value is pasted
+        self.assertTrue(self.app._validate_size(" 3"))
+        self.assertTrue(self.app._validate_size("3 "))
+        self.assertTrue(self.app._validate_size("+3"))
+        self.assertTrue(self.app._validate_size("03"))
+        self.assertFalse(self.app._validate_size("0"))
+        self.assertFalse(self.app._validate_size("+"))
+        self.assertFalse(self.app._validate_size(" "))
 
     def test_ensure_valid_size_enforces_bounds_and_resets_on_error(self):
-        """Ensure _ensure_valid_size clamps values and handles TclError path."""
+        """Ensure _ensure_valid_size clamps values and resets non-integer input."""
         # Below minimum -> clamped to 2
-        self.app.size_var.set(1)
-        self.app._ensure_valid_size()
-        self.assertEqual(self.app.size_var.get(), 2)
+        self.app.size_var.set("1")
+        self.assertEqual(self.app._ensure_valid_size(), 2)
+        self.assertEqual(self.app.size_var.get(), "2")
 
         # Above maximum -> clamped to 5
-        self.app.size_var.set(10)
-        self.app._ensure_valid_size()
-        self.assertEqual(self.app.size_var.get(), 5)
+        self.app.size_var.set("10")
+        self.assertEqual(self.app._ensure_valid_size(), 5)
+        self.assertEqual(self.app.size_var.get(), "5")
 
-        # Non-integer value in IntVar -> triggers TclError on get, resets to default (3)
+        # Non-integer value -> resets to default (3)
         self.app.size_var.set("abc")
-        self.app._ensure_valid_size()
-        self.assertEqual(self.app.size_var.get(), 3)
+        self.assertEqual(self.app._ensure_valid_size(), 3)
+        self.assertEqual(self.app.size_var.get(), "3")
+
+        # Empty field left behind by editing -> resets to default (3)
+        self.app.size_var.set("")
+        self.assertEqual(self.app._ensure_valid_size(), 3)
+
+        # Surrounding whitespace is dropped from an otherwise valid size
+        self.app.size_var.set(" 4 ")
+        self.assertEqual(self.app._ensure_valid_size(), 4)
+        self.assertEqual(self.app.size_var.get(), "4")
+
+    def test_widgets_created_on_demand(self):
+        """Entry grid is built on Compute; results Text only for real output."""
+        self.assertIsNone(self.app.results_text)
+        self.assertEqual(self.app.input_grid_frame.winfo_children(), [])
+
+        self.app.size_var.set("4")
+        self.app.compute_btn.invoke()
+        self.assertEqual(len(self.app.input_grid_frame.winfo_children()), 16)
+        # Placeholder stays on the lightweight Label
+        self.assertIsNone(self.app.results_text)
+        self.assertIsNotNone(self.app.placeholder_label)
+
+        # Shrinking the size rebuilds the grid with exactly N*N cells
+        self.app.size_var.set("2")
+        self.app.compute_btn.invoke()
+        self.assertEqual(len(self.app.input_grid_frame.winfo_children()), 4)
+
+    def test_results_promoted_to_text_on_first_output(self):
+        """The placeholder Label is swapped for a read-only Text on first result."""
+        self.app._set_results("1 0\n0 1")
+        self.assertIsNone(self.app.placeholder_label)
+        self.assertEqual(self.app.results_text.get("1.0", "end-1c"), "1 0\n0 1")
+        self.assertEqual(str(self.app.results_text.cget("state")), "disabled")
+
+        # Later placeholders are written into the same Text widget
+        text_widget = self.app.results_text
+        self.app.clear_btn.invoke()
+        self.assertIs(self.app.results_text, text_widget)
+
+    def test_size_check_reaches_owning_app(self):
+        """A second app on the same root does not take over the first spinbox."""
+        second = MatrixInverseApp(tk.Toplevel(self.root))
+        self.app.size_var.set("9")
+        second.size_var.set("4")
+        # <FocusOut> is delivered to the given widget; key events would go to
+        # whichever window has focus
+        self.app.size_spin.event_generate('<FocusOut>')
+        self.root.update()
+        self.assertEqual(self.app.size_var.get(), "5")
+        self.assertEqual(second.size_var.get(), "4")
+
+    def test_size_spin_owner_released_after_destroy(self):
+        """The spinbox -> app registry does not keep a destroyed app alive."""
+        owners = matrix_inverse_gui._SIZE_SPIN_OWNERS
+        spin_ref = weakref.ref(self.app.size_spin)
+        app_ref = weakref.ref(self.app)
+        self.assertIn(self.app.size_spin, owners)
+        self.root.destroy()
+        del self.app
+        gc.collect()
+        self.assertIsNone(app_ref())
+        self.assertIsNone(spin_ref())
+
+    def _pending_after_jobs(self):
+        return self.root.tk.splitlist(self.root.tk.call("after", "info"))
+
+    def test_resize_refresh_is_debounced(self):
+        """Back-to-back resizes leave a single pending layout refresh."""
+        self.app._on_resize()
+        # A size correction in between must not drop the pending resize job
+        self.app._run_size_check()
+        self.app._on_resize()
+        self.assertIsNotNone(self.app._resize_job)
+        self.assertEqual(self._pending_after_jobs(), (self.app._resize_job,))
+
+    def test_promote_to_text_stops_resize_tracking(self):
+        """Once the placeholder Label is gone, resizes schedule no refresh."""
+        self.app._on_resize()
+        self.app._set_results("1 0\n0 1")
+        self.assertIsNone(self.app._resize_job)
+        self.assertEqual(self._pending_after_jobs(), ())
+        self.assertEqual(self.app.results_section.bind('<Configure>'), "")
 
 
 if __name__ == "__main__":